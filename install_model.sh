@@ -2,10 +2,17 @@
 # Script: install_models.sh
 # Purpose: Download Hugging Face models to a custom location with easy replication
 # Colors for output
-RED='\033[0;31m'
-GREEN='\033[0;32m'
-YELLOW='\033[1;33m'
-NC='\033[0m' # No Color
+if [ -t 1 ]; then
+    RED='\033[0;31m'
+    GREEN='\033[0;32m'
+    YELLOW='\033[1;33m'
+    NC='\033[0m' # No Color
+else
+    RED=''
+    GREEN=''
+    YELLOW=''
+    NC=''
+fi
 
 # Default values
 DEFAULT_HF_PATH="/workspace/models/huggingface"
@@ -291,7 +298,6 @@ cat > "$PYTHON_SCRIPT" << EOF
 import os
 import sys
 import json
-import hashlib
 from pathlib import Path
 from datetime import datetime
 
@@ -300,7 +306,6 @@ os.environ['HF_HOME'] = '$HF_PATH'
 
 try:
     from huggingface_hub import snapshot_download, HfApi, scan_cache_dir
-    from huggingface_hub.utils import LocalEntryNotFoundError
 except ImportError as e:
     print(f"Error: Missing required package: {e}")
     print("Please install with: uv pip install huggingface-hub")
@@ -353,32 +358,32 @@ def check_model_completeness(model_name, cache_dir):
             print("Model not found in local cache")
             return False, expected_files, 0
         
+        # Index cached files by name once instead of rescanning every revision per expected file
+        cached_files = {}
+        for revision in local_model.revisions:
+            for cached_file in revision.files:
+                cached_files.setdefault(cached_file.file_path.name, cached_file)
+
         # Check each expected file
         missing_files = []
         corrupted_files = []
         local_size = 0
-        
+
         for filename, file_info in expected_files.items():
-            file_found = False
-            for revision in local_model.revisions:
-                for cached_file in revision.files:
-                    # Match by file path
-                    if cached_file.file_path.name == filename.split('/')[-1]:
-                        file_found = True
-                        local_size += cached_file.size_on_disk
-                        
-                        # Check file size
-                        if file_info['size'] and cached_file.size_on_disk != file_info['size']:
-                            corrupted_files.append(filename)
-                            print(f"  ❌ Size mismatch: {filename}")
-                            print(f"     Expected: {file_info['size']}, Got: {cached_file.size_on_disk}")
-                        break
-                if file_found:
-                    break
-            
-            if not file_found:
+            # Match by file path
+            cached_file = cached_files.get(filename.split('/')[-1])
+            if cached_file is None:
                 missing_files.append(filename)
                 print(f"  ❌ Missing: {filename}")
+                continue
+
+            local_size += cached_file.size_on_disk
+
+            # Check file size
+            if file_info['size'] and cached_file.size_on_disk != file_info['size']:
+                corrupted_files.append(filename)
+                print(f"  ❌ Size mismatch: {filename}")
+                print(f"     Expected: {file_info['size']}, Got: {cached_file.size_on_disk}")
         
         # Summary
         print(f"\\nLocal cache summary:")
@@ -403,7 +408,6 @@ def check_model_completeness(model_name, cache_dir):
             print("\\n✅ Model is fully downloaded and verified!")
             # Get the local path
             try:
-                from huggingface_hub import model_info
                 local_path = snapshot_download(
                     repo_id=model_name,
                     cache_dir=cache_dir,
@@ -150,7 +150,14 @@ run_vllm_server() {
     echo "Served as: $MODEL_NAME"
     echo "Tensor parallel size: $TENSOR_PARALLEL_SIZE"
     echo ""
-    echo "Command: vllm serve $MODEL_REPO --tensor-parallel-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --enable-auto-tool-choice --served-model-name $MODEL_NAME"
+    
+    # FP8 checkpoints also get an FP8 KV cache, halving KV memory per token
+    local kv_cache_args=()
+    if [[ "$MODEL_REPO" == *"FP8"* ]]; then
+        kv_cache_args=(--kv-cache-dtype fp8)
+    fi
+    
+    echo "Command: vllm serve $MODEL_REPO --tensor-parallel-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --enable-auto-tool-choice --enable-prefix-caching ${kv_cache_args[*]} --served-model-name $MODEL_NAME"
     echo ""
     echo "Press Ctrl+C to stop the server"
     echo "============================================================"
@@ -161,6 +168,8 @@ run_vllm_server() {
         --tool-call-parser glm45 \
         --reasoning-parser glm45 \
         --enable-auto-tool-choice \
+        --enable-prefix-caching \
+        "${kv_cache_args[@]}" \
         --served-model-name "$MODEL_NAME" \
 	--api-key YOUR_API_KEY
 }
@@ -178,7 +187,7 @@ run_sglang_server() {
     
     # Check if it's an FP8 model and set different parameters
     if [[ "$MODEL_REPO" == *"FP8"* ]]; then
-        echo "Command: python3 -m sglang.launch_server --model-path $MODEL_REPO --tp-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --speculative-algorithm EAGLE --speculative-num-steps 3 --speculative-eagle-topk 1 --speculative-num-draft-tokens 4 --mem-fraction-static 0.7 --disable-shared-experts-fusion --served-model-name $MODEL_NAME --host 0.0.0.0 --port 8000"
+        echo "Command: python3 -m sglang.launch_server --model-path $MODEL_REPO --tp-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --speculative-algorithm EAGLE --speculative-num-steps 3 --speculative-eagle-topk 1 --speculative-num-draft-tokens 4 --mem-fraction-static 0.7 --disable-shared-experts-fusion --served-model-name $MODEL_NAME --enable-metrics --host 0.0.0.0 --port 8000"
         echo ""
         echo "Press Ctrl+C to stop the server"
         echo "============================================================"
@@ -196,11 +205,12 @@ run_sglang_server() {
             --mem-fraction-static 0.7 \
             --disable-shared-experts-fusion \
             --served-model-name "$MODEL_NAME" \
+            --enable-metrics \
             --host 0.0.0.0 \
             --port 8000 \
 	    --api-key YOUR_API_KEY
     else
-        echo "Command: python3 -m sglang.launch_server --model-path $MODEL_REPO --tp-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --speculative-algorithm EAGLE --speculative-num-steps 3 --speculative-eagle-topk 1 --speculative-num-draft-tokens 4 --mem-fraction-static 0.7 --served-model-name $MODEL_NAME --host 0.0.0.0 --port 8000"
+        echo "Command: python3 -m sglang.launch_server --model-path $MODEL_REPO --tp-size $TENSOR_PARALLEL_SIZE --tool-call-parser glm45 --reasoning-parser glm45 --speculative-algorithm EAGLE --speculative-num-steps 3 --speculative-eagle-topk 1 --speculative-num-draft-tokens 4 --mem-fraction-static 0.7 --served-model-name $MODEL_NAME --enable-metrics --host 0.0.0.0 --port 8000"
         echo ""
         echo "Press Ctrl+C to stop the server"
         echo "============================================================"
@@ -217,6 +227,7 @@ run_sglang_server() {
             --speculative-num-draft-tokens 4 \
             --mem-fraction-static 0.7 \
             --served-model-name "$MODEL_NAME" \
+            --enable-metrics \
             --host 0.0.0.0 \
             --port 8000 \
 	    --api-key YOUR_API_KEY